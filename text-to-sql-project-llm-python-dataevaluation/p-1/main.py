@@ -1,4 +1,8 @@
+import os
+import sys
 import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
 from typing import Dict, List, Any
 from abc import ABC, abstractmethod
 
@@ -119,6 +123,28 @@ class DataFrameManager:
             'employees': employees_df
         }
 
+    @staticmethod
+    def load_snapshot(directory: str, table_names: List[str]) -> Dict[str, pd.DataFrame]:
+        """Open the Arrow IPC snapshot written by the loader (p-2/df_db_load.py) without copying it.
+
+        The files are memory-mapped and the columns stay Arrow-backed, so pages are shared
+        between worker processes opening the same snapshot. The files are sorted by their key
+        columns, which are listed in df.attrs['key_columns'].
+        """
+        dataframes = {}
+        for name in table_names:
+            path = os.path.join(directory, f"{name}.arrow")
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"Table '{name}' is missing from snapshot {directory}")
+            with pa.memory_map(path, 'r') as source:
+                table = ipc.open_file(source).read_all()
+            df = table.to_pandas(types_mapper=pd.ArrowDtype)
+            key_columns = (table.schema.metadata or {}).get(b'key_columns')
+            if key_columns:
+                df.attrs['key_columns'] = key_columns.decode().split(',')
+            dataframes[name] = df
+        return dataframes
+
     @staticmethod
     def get_relationships() -> Dict[str, Dict[str, str]]:
         return {
@@ -131,8 +157,13 @@ class DataFrameManager:
 
 # Example usage
 if __name__ == "__main__":
-    dataframes = DataFrameManager.create_sample_dataframes()
     relationships = DataFrameManager.get_relationships()
+    # Pass --snapshot <dir> to start from a snapshot instead of rebuilding the sample data
+    if '--snapshot' in sys.argv:
+        snapshot_dir = sys.argv[sys.argv.index('--snapshot') + 1]
+        dataframes = DataFrameManager.load_snapshot(snapshot_dir, list(relationships))
+    else:
+        dataframes = DataFrameManager.create_sample_dataframes()
     df_filter = DataFrameFilter(dataframes, relationships)
 
     # Example 1: Case-insensitive filtering for events in the USA attended by companies in the Technology industry
@@ -1,6 +1,11 @@
+import os
+import sys
 import psycopg2
 import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
 from psycopg2 import sql
+from typing import Dict, List
 
 # Connection parameters
 connection_params = {
@@ -10,6 +15,18 @@ connection_params = {
         "password": "root"
     }
 
+# Default directory the columnar snapshot of the tables is written to (<project root>/snapshot),
+# override with --snapshot <dir>
+default_snapshot_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "snapshot")
+
+# Key columns of each table (same as the primary keys below), the snapshot is sorted by them
+table_keys = {
+    'events': ['event_url'],
+    'attendees': ['event_url', 'company_url'],
+    'companies': ['company_url'],
+    'company_contacts': ['company_url'],
+    'employees': ['person_id']
+}
 
 # Sample DataFrames
 events_df = pd.DataFrame({
@@ -158,7 +175,39 @@ def insert_data(cursor):
     """)
     cursor.executemany(employees_insert_query, employees_df.values.tolist())
 
+def write_snapshot(dataframes: Dict[str, pd.DataFrame], keys: Dict[str, List[str]], directory: str):
+    """Write each DataFrame as an uncompressed Arrow IPC file so readers can memory-map it zero-copy."""
+    os.makedirs(directory, exist_ok=True)
+    for name, df in dataframes.items():
+        key_columns = keys[name]
+        table = pa.Table.from_pandas(df.sort_values(key_columns), preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[b'key_columns'] = ','.join(key_columns).encode()
+        table = table.replace_schema_metadata(metadata)
+
+        # Write to a temporary file and swap it in, so workers never map a half-written snapshot
+        path = os.path.join(directory, f"{name}.arrow")
+        with pa.OSFile(path + ".tmp", 'wb') as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(path + ".tmp", path)
+
 def main():
+    dataframes = {
+        'events': events_df,
+        'attendees': attendees_df,
+        'companies': companies_df,
+        'company_contacts': company_contacts_df,
+        'employees': employees_df
+    }
+
+    # Write columnar snapshot
+    snapshot_dir = default_snapshot_dir
+    if '--snapshot' in sys.argv:
+        snapshot_dir = sys.argv[sys.argv.index('--snapshot') + 1]
+    write_snapshot(dataframes, table_keys, snapshot_dir)
+    print(f"Snapshot written to {snapshot_dir}")
+
     # Connect to PostgreSQL
     try:
         conn = psycopg2.connect(**connection_params)
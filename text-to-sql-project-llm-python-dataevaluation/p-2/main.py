@@ -1,7 +1,7 @@
 import psycopg2
 import pandas as pd
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Iterator, Optional
 
 class QueryBuilder(ABC):
     @abstractmethod
@@ -96,6 +96,85 @@ class QueryExecutor:
                 results = cur.fetchall()
         return pd.DataFrame(results, columns=columns)
 
+    def execute_in_chunks(self, query: str, params: List[Any], chunk_size: int, first_chunk_size: Optional[int] = None) -> 'ChunkedCursor':
+        return ChunkedCursor(self.db_config, query, params, chunk_size, first_chunk_size)
+
+class ChunkedCursor:
+    """Server-side (named) cursor read in chunks, so only one chunk is held in memory at a time.
+
+    The query runs and `first_chunk` (possibly empty, but with the columns) is fetched on creation.
+    The connection stays open until the chunks are exhausted, a fetch fails or close() is called.
+    """
+    def __init__(self, db_config: Dict[str, str], query: str, params: List[Any], chunk_size: int, first_chunk_size: Optional[int] = None):
+        self.chunk_size = chunk_size
+        self.conn = psycopg2.connect(**db_config)
+        try:
+            self.cur = self.conn.cursor(name='chunked_fetch')
+            self.cur.itersize = chunk_size
+            self.cur.execute(query, params)
+        except Exception:
+            self.conn.close()
+            raise
+        self.first_chunk = self._fetch(first_chunk_size or chunk_size)
+        self.first_pending = True
+
+    def __iter__(self) -> 'ChunkedCursor':
+        return self
+
+    def __next__(self) -> pd.DataFrame:
+        if self.first_pending:
+            self.first_pending = False
+            return self.first_chunk
+        if self.conn.closed:
+            raise StopIteration
+        chunk = self._fetch(self.chunk_size)
+        if chunk.empty:
+            self.close()
+            raise StopIteration
+        return chunk
+
+    def _fetch(self, size: int) -> pd.DataFrame:
+        try:
+            results = self.cur.fetchmany(size)
+            columns = [desc[0] for desc in self.cur.description]
+        except Exception:
+            self.close()
+            raise
+        return pd.DataFrame(results, columns=columns)
+
+    def close(self) -> None:
+        if not self.conn.closed:
+            try:
+                self.cur.close()
+            finally:
+                self.conn.close()
+
+class QueryResult:
+    """Result of DataQueryService.fetch_data, use it as a context manager (or call close()).
+
+    The query runs exactly once, inside fetch_data, so connection and SQL errors are raised there.
+    `preflight_rows` is the row count capped at `small_result_rows + 1`; `exceeds_threshold` tells
+    when it hit the cap, the real size is then unknown. `chunks` is the full table and can be
+    iterated only once; when streamed it holds an open connection until exhausted or closed.
+    `llm_data` is what may be sent to the LLM (None unless requested).
+    """
+    def __init__(self, preflight_rows: int, exceeds_threshold: bool, strategy: str, chunks: Iterator[pd.DataFrame], llm_data: Optional[pd.DataFrame] = None):
+        self.preflight_rows = preflight_rows
+        self.exceeds_threshold = exceeds_threshold
+        self.strategy = strategy
+        self.chunks = chunks
+        self.llm_data = llm_data
+
+    def __enter__(self) -> 'QueryResult':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if hasattr(self.chunks, 'close'):
+            self.chunks.close()
+
 class QueryGenerator:
     def __init__(self, query_builder: QueryBuilder):
         self.query_builder = query_builder
@@ -123,14 +202,38 @@ class QueryGenerator:
         return required_tables
 
 class DataQueryService:
-    def __init__(self, query_generator: QueryGenerator, query_executor: QueryExecutor):
+    def __init__(self, query_generator: QueryGenerator, query_executor: QueryExecutor,
+                 small_result_rows: int = 10, chunk_size: int = 1000, head_rows: int = 10):
+        if head_rows > small_result_rows:
+            raise ValueError(f"head_rows ({head_rows}) can't be larger than small_result_rows ({small_result_rows})")
         self.query_generator = query_generator
         self.query_executor = query_executor
+        self.small_result_rows = small_result_rows
+        self.chunk_size = chunk_size
+        self.head_rows = head_rows
 
     def query_data(self, filter_arguments: List[Tuple[str, str, Any]], output_columns: List[str]) -> pd.DataFrame:
         query, params = self.query_generator.generate_query(filter_arguments, output_columns)
         return self.query_executor.execute(query, params)
 
+    def fetch_data(self, filter_arguments: List[Tuple[str, str, Any]], output_columns: List[str], for_llm: bool = False) -> QueryResult:
+        """Run the query once on a server-side cursor. Its first batch, capped at small_result_rows + 1,
+        is the preflight count: a small result is fetched fully, a larger one is streamed."""
+        query, params = self.query_generator.generate_query(filter_arguments, output_columns)
+        # Stable order, so the head given to the LLM is the same on every run
+        query += "\nORDER BY " + ", ".join(str(i) for i in range(1, len(output_columns) + 1))
+
+        cursor = self.query_executor.execute_in_chunks(query, params, self.chunk_size, first_chunk_size=self.small_result_rows + 1)
+        first_chunk = cursor.first_chunk
+        exceeds_threshold = len(first_chunk) > self.small_result_rows
+        if exceeds_threshold:
+            # Large results stay out of the LLM context, it only gets the head to summarize
+            strategy, chunks, llm_data = 'streaming', cursor, first_chunk.head(self.head_rows)
+        else:
+            cursor.close()
+            strategy, chunks, llm_data = 'full', iter([first_chunk]), first_chunk
+        return QueryResult(len(first_chunk), exceeds_threshold, strategy, chunks, llm_data if for_llm else None)
+
 # Usage
 if __name__ == "__main__":
     db_config = {
@@ -176,5 +279,10 @@ if __name__ == "__main__":
     ]
     output_columns = ['event_city', 'event_name', 'event_country', 'company_industry', 'company_name', 'company_url', 'person_first_name', 'person_last_name', 'person_seniority']
 
-    result_df = data_query_service.query_data(filter_arguments, output_columns)
-    print(result_df)
\ No newline at end of file
+    with data_query_service.fetch_data(filter_arguments, output_columns) as result:
+        if result.exceeds_threshold:
+            print(f"More than {data_query_service.small_result_rows} rows, fetch strategy: {result.strategy}")
+        else:
+            print(f"{result.preflight_rows} rows, fetch strategy: {result.strategy}")
+        for result_df in result.chunks:
+            print(result_df)
\ No newline at end of file